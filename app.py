@@ -1,8 +1,14 @@
+import mmap
+import os
+import sys
+from pathlib import Path
+
 from parser import (
     parser,
     to_cpp,
     register_type_provider,
     valid_dtypes,
+    valid_dtypes_set,
     MissingTypeError,
     parse_code,
 )
@@ -12,16 +18,38 @@ def cli_type_provider(var, allowed):
     # Fallback interactive provider for the CLI tool only.
     choices = ", ".join(allowed)
     dtype = input(f"Enter datatype for variable '{var}' ({choices}): ").strip()
-    while dtype not in allowed:
+    while dtype not in valid_dtypes_set:
         dtype = input(f"Invalid datatype. Enter again for '{var}' ({choices}): ").strip()
     return dtype
 
 
+# Files at or below this size are read normally; mapping them costs more
+# than the copy it saves.
+MMAP_THRESHOLD = 64 * 1024
+# Both read paths decode with this, so results never depend on file size or
+# on the platform's locale encoding.
+SOURCE_ENCODING = "utf-8"
+
+
+def read_source(path):
+    """Return the UTF-8 text of ``path``, memory-mapping large files."""
+    if os.path.getsize(path) <= MMAP_THRESHOLD:
+        with open(path, encoding=SOURCE_ENCODING) as f:
+            return f.read()
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # Decode straight from the mapping; no intermediate bytes copy.
+        text = str(mm, SOURCE_ENCODING)
+        has_cr = mm.find(b"\r") != -1
+    # Match text-mode reads: the lexer only understands "\n" line endings.
+    if has_cr:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
 def main():
     register_type_provider(cli_type_provider)
 
-    with open("input.txt") as f:
-        data = f.read()
+    data = read_source("input.txt")
 
     print("🔹 Starting parsing... You’ll be asked for variable datatypes where needed.\n")
 
@@ -32,10 +60,10 @@ def main():
 
     cpp_code = to_cpp(result)
     print("\n✅ Generated C++ code:\n")
-    print(cpp_code)
+    sys.stdout.write(cpp_code)
+    sys.stdout.write("\n")
 
-    with open("output.cpp", "w") as f:
-        f.write(cpp_code)
+    Path("output.cpp").write_text(cpp_code)
 
 
 if __name__ == "__main__":
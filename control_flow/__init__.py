@@ -1 +1,12 @@
 """Control-flow helpers for code generation (if/for/while)."""
+
+# Indentation prefixes (four spaces per level), built once so emitters do not
+# rebuild them for every statement.
+_INDENTS = [" " * (i * 4) for i in range(64)]
+
+
+def indent_str(level):
+    """Return the whitespace prefix for ``level`` levels of indentation."""
+    if level < len(_INDENTS):
+        return _INDENTS[level]
+    return " " * (level * 4)
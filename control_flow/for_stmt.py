@@ -0,0 +1,30 @@
+"""Helpers for generating C++ code for for-loops."""
+
+from control_flow import indent_str
+
+
+def generate_for_cpp(stmt, indent, format_assignment, generate_cpp, out):
+    """Generate C++ code for a 'for' statement node.
+
+    stmt: For node with 'init', 'condition', 'update', and 'body' attributes
+    indent: current indentation level (in blocks, not spaces)
+    format_assignment: function used to format assignment nodes
+    generate_cpp: function that writes C++ for the nested body into ``out``
+    out: list of output fragments to append to
+    """
+    space = indent_str(indent)
+
+    init_part = ""
+    if stmt.init is not None:
+        # No type declaration - variable already declared at function start
+        init_part = format_assignment(stmt.init, include_type=False)
+
+    cond_part = stmt.condition if stmt.condition is not None else ""
+
+    update_part = ""
+    if stmt.update is not None:
+        update_part = format_assignment(stmt.update, include_type=False)
+
+    out.append(space + f"for ({init_part}; {cond_part}; {update_part}) {{\n")
+    generate_cpp(stmt.body, indent + 1)
+    out.append(space + "}\n")
\ No newline at end of file
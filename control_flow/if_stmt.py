@@ -0,0 +1,17 @@
+"""Helpers for generating C++ code for if-statements."""
+
+from control_flow import indent_str
+
+
+def generate_if_cpp(stmt, indent, generate_cpp, out):
+    """Generate C++ code for an 'if' statement node.
+
+    stmt: If node with 'condition' and 'body' attributes
+    indent: current indentation level (in blocks, not spaces)
+    generate_cpp: function that writes C++ for the nested body into ``out``
+    out: list of output fragments to append to
+    """
+    space = indent_str(indent)
+    out.append(space + f"if ({stmt.condition}) {{\n")
+    generate_cpp(stmt.body, indent + 1)
+    out.append(space + "}\n")
@@ -61,9 +61,10 @@ reserved_literals = {
 }
 
 
-# String literals
+# String literals (unrolled loop: runs of plain chars between escapes, so the
+# regex engine never backtracks character by character)
 def t_STRING(t):
-    r'"([^\\"]|\\.)*"'
+    r'"[^"\\]*(?:\\.[^"\\]*)*"'
     t.value = t.value[1:-1]  # Remove quotes
     return t
 
@@ -98,9 +99,9 @@ def t_COMMENT_SINGLE(t):
     pass  # Ignore comment text
 
 
-# Multi-line comments
+# Multi-line comments (unrolled form of /\*[\s\S]*?\*/ without lazy backtracking)
 def t_COMMENT_MULTI(t):
-    r'/\*[\s\S]*?\*/'
+    r'/\*[^*]*\*+(?:[^/*][^*]*\*+)*/'
     pass  # Ignore comment text
 
 
@@ -1,19 +1,28 @@
 import ply.yacc as yacc
-from lexer import tokens
+from lexer import tokens, lexer as _base_lexer
 import sys
-import importlib
-import re
-
-_if_mod = importlib.import_module("control_flow.if")
-_for_mod = importlib.import_module("control_flow.for")
-_while_mod = importlib.import_module("control_flow.while")
-symbol_table = {}
-has_return = False
+import hashlib
+import inspect
+import os
+import pickle
+import pickletools
+import tempfile
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+
+from control_flow import indent_str
+from control_flow.if_stmt import generate_if_cpp
+from control_flow.for_stmt import generate_for_cpp
+from control_flow.while_stmt import generate_while_cpp
 
 valid_dtypes = [
     "int", "float", "string", "long", "char", "array", "vector",
     "set", "set_int", "set_float", "set_double", "set_char", "set_string"
 ]
+valid_dtypes_set = frozenset(valid_dtypes)
 
 class MissingTypeError(Exception):
     """Raised when the parser needs a datatype for a variable but none is provided.
@@ -25,14 +34,149 @@ class MissingTypeError(Exception):
 
 
 # Optional callback that external callers can register to supply types.
+# This is the process-wide default; ``parse_context`` overrides it per parse.
 type_provider = None
 
+
+@dataclass
+class ParseContext:
+    """Mutable state for a single parse.
+
+    Grammar actions read and update the innermost context of the current
+    thread, so concurrent parses (e.g. threaded Flask requests) never share a
+    symbol table or type provider.
+    """
+
+    type_provider: Optional[Callable] = None
+    symbol_table: dict = field(default_factory=dict)
+    has_return: bool = False
+
+    def reset_scope(self):
+        """Start a fresh function scope."""
+        self.symbol_table = {}
+        self.has_return = False
+
+
+_local = threading.local()
+
+
+def _context_stack():
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+def _current_ctx():
+    """Return the active ParseContext for this thread.
+
+    Outside any parse a throwaway context using the registered provider is
+    returned, and anything written to its ``symbol_table`` is discarded. The
+    only caller expected to run there is code generation: ``_emit_function``
+    calls ``ask_type`` for parameters without a recorded type when ``to_cpp``
+    is used outside a ``parse_context``. Grammar actions always run inside
+    ``parse_code``, which guarantees an active context.
+    """
+    stack = _context_stack()
+    if stack:
+        return stack[-1]
+    return ParseContext(type_provider=type_provider)
+
+
+@contextmanager
+def parse_context(provider=None):
+    """Run parsing and code generation in an isolated context.
+
+    ``provider`` has the same signature as for ``register_type_provider`` and
+    applies only inside the ``with`` block, on the current thread. With no
+    provider, types are inferred where possible.
+    """
+    stack = _context_stack()
+    ctx = ParseContext(type_provider=provider)
+    stack.append(ctx)
+    try:
+        yield ctx
+    finally:
+        stack.pop()
+
+
+# -------- AST Nodes --------
+# Statement nodes use explicit __slots__ to keep per-node memory small; code
+# generation dispatches on the node class.
+
+@dataclass
+class Function:
+    __slots__ = ("name", "params", "body", "return_type", "symbols", "locals")
+    name: str
+    params: list
+    body: list
+    return_type: str
+    symbols: dict
+    locals: dict
+
+
+@dataclass
+class Assign:
+    __slots__ = ("var", "value")
+    var: str
+    value: str
+
+
+@dataclass
+class Declare:
+    __slots__ = ("var",)
+    var: str
+
+
+@dataclass
+class If:
+    __slots__ = ("condition", "body")
+    condition: str
+    body: list
+
+
+@dataclass
+class While:
+    __slots__ = ("condition", "body")
+    condition: str
+    body: list
+
+
+@dataclass
+class For:
+    __slots__ = ("init", "condition", "update", "body")
+    init: "Assign | None"
+    condition: "str | None"
+    update: "Assign | None"
+    body: list
+
+
+@dataclass
+class FunctionCall:
+    __slots__ = ("name", "args")
+    name: str
+    args: str
+
+
+@dataclass
+class Return:
+    __slots__ = ("value",)
+    value: str
+
+
 def parse_code(code):
-    """Parse pseudo-code and return AST. Reset state before parsing."""
-    global symbol_table, has_return
-    symbol_table = {}
-    has_return = False
-    return parser.parse(code)
+    """Parse pseudo-code and return AST. Reset state before parsing.
+
+    Uses the innermost active ``parse_context``; without one, the parse runs
+    in a fresh context with the registered type provider.
+    """
+    stack = _context_stack()
+    if not stack:
+        with parse_context(type_provider):
+            return parse_code(code)
+    stack[-1].reset_scope()
+    # PLY lexers carry position state, so each parse gets its own copy.
+    return parser.parse(code, lexer=_base_lexer.clone())
 
 def register_type_provider(fn):
     """Register a callback used to resolve unknown variable types.
@@ -40,36 +184,49 @@ def register_type_provider(fn):
     The callback should have the signature ``fn(var_name: str, valid: list[str])``
     and return a string from ``valid``. If it cannot provide a type it should
     raise ``MissingTypeError``.
+
+    The provider is shared by every thread; use ``parse_context`` to supply
+    one for a single parse instead.
     """
 
     global type_provider
     type_provider = fn
+
+# Datatypes for literal values, looked up by exact Python type. bool is listed
+# so it still maps to "int", as it did with isinstance checks.
+_INFERRED_TYPES = {int: "int", float: "float", bool: "int"}
+
+
 # Detect datatype automatically based on assigned value
 def infer_type(value):
-    if isinstance(value, int):
-        return "int"
-    if isinstance(value, float):
-        return "float"
-    if isinstance(value, str):
-        if value.startswith('"') and value.endswith('"'):
+    vtype = type(value)
+    inferred = _INFERRED_TYPES.get(vtype)
+    if inferred is not None:
+        return inferred
+    if vtype is str:
+        # First and last character in one slice-and-compare.
+        ends = value[:1] + value[-1:]
+        if ends == '""':
             return "string"
-        if value.startswith("'") and value.endswith("'"):
+        if ends == "''":
             return "char"
     return None
 
 
 # Ask datatype from a registered provider (no direct stdin usage here).
 def ask_type(var):
-    if type_provider is None:
+    ctx = _current_ctx()
+    if ctx.type_provider is None:
         # No provider registered – force the caller to handle this case.
         raise MissingTypeError(var)
 
-    dtype = type_provider(var, valid_dtypes).strip()
-    if dtype not in valid_dtypes:
+    dtype = ctx.type_provider(var, valid_dtypes).strip()
+    if dtype not in valid_dtypes_set:
         raise MissingTypeError(var)
-    return dtype
+    # Provider answers are fresh strings (stdin, JSON); share one copy each.
+    return sys.intern(dtype)
 
-def handle_assignment(var, value, is_expression=False):
+def handle_assignment(var, value, is_expression=False, *, is_identifier=None):
     """Update symbol_table for an assignment and return normalized value string.
 
     For complex expressions we mostly fall back to asking the user for the type
@@ -77,10 +234,14 @@ def handle_assignment(var, value, is_expression=False):
 
     This also ensures both the assigned variable and any source identifier
     (e.g. in "b = a") have datatypes recorded.
+
+    Callers that know from the grammar whether the RHS is a bare identifier
+    pass ``is_identifier`` so it is not re-derived from the string.
     
     Priority: Type provider (if registered) > Type inference (if no provider)
     """
-    global symbol_table
+    ctx = _current_ctx()
+    symbol_table = ctx.symbol_table
 
     # If variable already has a type (from type provider or previous assignment), keep it
     if var in symbol_table:
@@ -88,7 +249,7 @@ def handle_assignment(var, value, is_expression=False):
 
     # If a type provider is registered, ALWAYS use it (don't fall back to inference)
     # If the provider can't provide a type, let that error propagate to the frontend
-    if type_provider is not None:
+    if ctx.type_provider is not None:
         symbol_table[var] = ask_type(var)  # Will raise MissingTypeError if provider doesn't have it
         return str(value)
 
@@ -103,7 +264,9 @@ def handle_assignment(var, value, is_expression=False):
     # Handle string values (identifiers or expressions)
     if isinstance(value, str):
         # If RHS is a single identifier (not an expression like "x + y")
-        if not is_expression and value.isidentifier():
+        if is_identifier is None:
+            is_identifier = not is_expression and value.isidentifier()
+        if is_identifier:
             # Ensure the source identifier has a type.
             if value not in symbol_table:
                 symbol_table[value] = ask_type(value)
@@ -121,14 +284,16 @@ def handle_assignment(var, value, is_expression=False):
     return str(value)
 
 
-_id_pattern = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+def _expr_text(val):
+    """Return the text of an ``expression`` value.
 
-
-def _identifiers_in_expr(expr):
-    """Return a list of identifier-like names found in an expression string."""
-    if not isinstance(expr, str):
-        return []
-    return _id_pattern.findall(expr)
+    Expression productions build a list of fragments and only join it here,
+    at the point a statement consumes it. NUMBER and ID alternatives in the
+    same rules pass through unchanged.
+    """
+    if isinstance(val, list):
+        return "".join(val)
+    return val
 
 
 # -------- Grammar Rules --------
@@ -142,28 +307,27 @@ def p_function_list(p):
     """function_list : function_list function
                      | function"""
     if len(p) == 3:
-        p[0] = p[1] + [p[2]]
+        p[1].append(p[2])
+        p[0] = p[1]
     else:
         p[0] = [p[1]]
 
 
 def p_function_header(p):
     """function_header : FN ID LPAREN param_list_opt RPAREN"""
-    global symbol_table, has_return
-
     # Start a fresh scope for each function while parsing its body.
-    symbol_table = {}
-    has_return = False
+    _current_ctx().reset_scope()
     p[0] = {"name": p[2], "params": p[4] or []}
 
 def p_function(p):
     """function : function_header LBRACE stmt_list RBRACE"""
-    global has_return, symbol_table
+    ctx = _current_ctx()
+    symbol_table = ctx.symbol_table
 
     fn_info = p[1]
 
     # Get return type from symbol table or default to void
-    if has_return and "__return_type__" in symbol_table:
+    if ctx.has_return and "__return_type__" in symbol_table:
         ret_type = symbol_table.pop("__return_type__")  # Remove special key
     else:
         ret_type = "void"
@@ -176,19 +340,23 @@ def p_function(p):
             symbol_table[param] = ask_type(param)
 
     function_symbols = dict(symbol_table)
-
-    p[0] = {
-        "type": "function",
-        "name": fn_info["name"],
-        "params": params,
-        "body": p[3],
-        "return_type": ret_type,
-        "symbols": function_symbols,
+    # Variables that need a declaration at the top of the function body.
+    function_locals = {
+        var: dtype for var, dtype in function_symbols.items()
+        if var not in params and not var.startswith("__")
     }
 
+    p[0] = Function(
+        name=fn_info["name"],
+        params=params,
+        body=p[3],
+        return_type=ret_type,
+        symbols=function_symbols,
+        locals=function_locals,
+    )
+
     # Reset parse state for safety before the next function.
-    symbol_table = {}
-    has_return = False
+    ctx.reset_scope()
 def p_param_list_opt(p):
     """param_list_opt : param_list
                       | empty"""
@@ -204,7 +372,8 @@ def p_param_list(p):
     if len(p) == 2:
         p[0] = [p[1]]
     else:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
 
 
 def p_stmt_list(p):
@@ -212,7 +381,8 @@ def p_stmt_list(p):
                  | statement
                  | empty"""
     if len(p) == 3:
-        p[0] = p[1] + [p[2]]
+        p[1].append(p[2])
+        p[0] = p[1]
     elif p[1] is None:
         p[0] = []
     else:
@@ -224,49 +394,45 @@ def p_statement_assign_simple(p):
                  | ID ASSIGN ID SEMICOLON"""
     var = p[1]
     val = p[3]
-    normalized = handle_assignment(var, val, is_expression=False)
-    p[0] = {"type": "assign", "var": var, "value": normalized}
+    is_id = p.slice[3].type == "ID"
+    normalized = handle_assignment(var, val, is_expression=False, is_identifier=is_id)
+    p[0] = Assign(var, normalized)
 
 
 def p_statement_assign_expr(p):
     """statement : ID ASSIGN expression SEMICOLON"""
     var = p[1]
-    val = p[3]
-    normalized = handle_assignment(var, val, is_expression=True)
-    p[0] = {"type": "assign", "var": var, "value": normalized}
+    val = _expr_text(p[3])
+    normalized = handle_assignment(var, val, is_expression=True, is_identifier=False)
+    p[0] = Assign(var, normalized)
 
 
 def p_statement_declare(p):
     """statement : DECL ID SEMICOLON"""
     var = p[2]
+    symbol_table = _current_ctx().symbol_table
     
     # If variable not yet typed, ask the type provider
     if var not in symbol_table:
         symbol_table[var] = ask_type(var)
     
     # Declare-only statement: no initialization
-    p[0] = {"type": "declare", "var": var}
+    p[0] = Declare(var)
 
 
 def p_statement_if(p):
     """statement : IF LPAREN condition RPAREN LBRACE stmt_list RBRACE"""
-    p[0] = {"type": "if", "condition": p[3], "body": p[6]}
+    p[0] = If(condition=p[3], body=p[6])
 
 
 def p_statement_while(p):
     """statement : WHILE LPAREN condition RPAREN LBRACE stmt_list RBRACE"""
-    p[0] = {"type": "while", "condition": p[3], "body": p[6]}
+    p[0] = While(condition=p[3], body=p[6])
 
 
 def p_statement_for(p):
     """statement : FOR LPAREN for_init_opt SEMICOLON condition_opt SEMICOLON for_update_opt RPAREN LBRACE stmt_list RBRACE"""
-    p[0] = {
-        "type": "for",
-        "init": p[3],
-        "condition": p[5],
-        "update": p[7],
-        "body": p[10],
-    }
+    p[0] = For(init=p[3], condition=p[5], update=p[7], body=p[10])
 
 
 def p_for_init_opt(p):
@@ -279,10 +445,13 @@ def p_for_init_opt(p):
         return
 
     var = p[1]
-    val = p[3]
-    is_expr = not isinstance(val, (int, float)) and not (isinstance(val, str) and val.isidentifier())
-    normalized = handle_assignment(var, val, is_expression=is_expr)
-    p[0] = {"type": "assign", "var": var, "value": normalized}
+    val = _expr_text(p[3])
+    # The matched alternative says what the RHS is; no need to inspect it.
+    rhs = p.slice[3].type
+    normalized = handle_assignment(
+        var, val, is_expression=rhs == "expression", is_identifier=rhs == "ID"
+    )
+    p[0] = Assign(var, normalized)
 
 
 def p_condition_opt(p):
@@ -301,32 +470,36 @@ def p_for_update_opt(p):
         return
 
     var = p[1]
-    val = p[3]
+    val = _expr_text(p[3])
     # Update should never redeclare the type, but should still track it
-    is_expr = not isinstance(val, (int, float)) and not (isinstance(val, str) and val.isidentifier())
-    normalized = handle_assignment(var, val, is_expression=is_expr)
-    p[0] = {"type": "assign", "var": var, "value": normalized}
+    rhs = p.slice[3].type
+    normalized = handle_assignment(
+        var, val, is_expression=rhs == "expression", is_identifier=rhs == "ID"
+    )
+    p[0] = Assign(var, normalized)
 
 
 def p_statement_return(p):
     """statement : RETURN expression SEMICOLON
                  | RETURN NUMBER SEMICOLON
                  | RETURN ID SEMICOLON"""
-    global has_return
-    has_return = True
+    ctx = _current_ctx()
+    symbol_table = ctx.symbol_table
+    ctx.has_return = True
     
-    ret_val = p[2]
+    ret_val = _expr_text(p[2])
     
     # Always ask for return type - no inference
     if "__return_type__" not in symbol_table:
         symbol_table["__return_type__"] = ask_type("function_return_type")
     
-    p[0] = {"type": "return", "value": ret_val}
+    p[0] = Return(ret_val)
 
 def p_statement_function_call(p):
     """statement : ID LPAREN argument_list_opt RPAREN SEMICOLON"""
     func_name = p[1]
     args = p[3] or []
+    symbol_table = _current_ctx().symbol_table
     
     # Ensure all argument identifiers have types
     for arg in args:
@@ -334,13 +507,21 @@ def p_statement_function_call(p):
             symbol_table[arg] = ask_type(arg)
     
     args_str = ", ".join(str(arg) for arg in args)
-    p[0] = {"type": "function_call", "name": func_name, "args": args_str}
+    p[0] = FunctionCall(func_name, args_str)
+
+
+# Padded operator fragments, built once and shared by every expression.
+_OP_FRAGMENTS = {op: sys.intern(f" {op} ") for op in ("+", "-", "*", "/", "%")}
 
 
 def p_expression_binop_addsub(p):
     """expression : expression PLUS term
                   | expression MINUS term"""
-    p[0] = f"{p[1]} {p[2]} {p[3]}"
+    # Extend the left operand's fragment list in place (it is owned by this
+    # reduction), so long chains stay linear instead of re-copying text.
+    p[1].append(_OP_FRAGMENTS[p[2]])
+    p[1].extend(p[3])
+    p[0] = p[1]
 
 
 def p_expression_term(p):
@@ -352,7 +533,9 @@ def p_term_binop(p):
     """term : term TIMES factor
              | term DIVIDE factor
              | term MOD factor"""
-    p[0] = f"{p[1]} {p[2]} {p[3]}"
+    p[1].append(_OP_FRAGMENTS[p[2]])
+    p[1].extend(p[3])
+    p[0] = p[1]
 
 
 def p_term_factor(p):
@@ -362,35 +545,36 @@ def p_term_factor(p):
 
 def p_factor_number(p):
     """factor : NUMBER"""
-    p[0] = str(p[1])
+    p[0] = [str(p[1])]
 
 
 def p_factor_string(p):
     """factor : STRING"""
     # STRING tokens have quotes already removed by lexer
     # Re-add quotes for C++ output
-    p[0] = f'"{p[1]}"'
+    p[0] = [f'"{p[1]}"']
 
 
 def p_factor_char(p):
     """factor : CHAR"""
     # CHAR tokens have quotes already removed by lexer
     # Re-add single quotes for C++ output
-    p[0] = f"'{p[1]}'"
+    p[0] = [f"'{p[1]}'"]
 
 
 def p_factor_id(p):
     """factor : ID"""
     var = p[1]
+    symbol_table = _current_ctx().symbol_table
     # Ensure any identifier used in an expression has a datatype.
     if var not in symbol_table:
         symbol_table[var] = ask_type(var)
-    p[0] = var
+    p[0] = [var]
 
 
 def p_factor_group(p):
     """factor : LPAREN expression RPAREN"""
-    p[0] = f"({p[2]})"
+    p[0] = [f"({_expr_text(p[2])})"]
 
 
 def p_condition(p):
@@ -400,7 +584,7 @@ def p_condition(p):
                  | expression GE expression
                  | expression EQ expression
                  | expression NE expression"""
-    p[0] = f"{p[1]} {p[2]} {p[3]}"
+    p[0] = f"{_expr_text(p[1])} {p[2]} {_expr_text(p[3])}"
 
 
 def p_empty(p):
@@ -422,6 +606,7 @@ def p_factor_function_call(p):
     """factor : ID LPAREN argument_list_opt RPAREN"""
     func_name = p[1]
     args = p[3] or []
+    symbol_table = _current_ctx().symbol_table
     
     # Ensure all argument identifiers have types
     for arg in args:
@@ -430,7 +615,7 @@ def p_factor_function_call(p):
     
     # Format as C++ function call
     args_str = ", ".join(str(arg) for arg in args)
-    p[0] = f"{func_name}({args_str})"
+    p[0] = [f"{func_name}({args_str})"]
 
 
 def p_argument_list_opt(p):
@@ -445,12 +630,13 @@ def p_argument_list(p):
     if len(p) == 2:
         p[0] = [p[1]]
     else:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
 
 
 def p_argument(p):
     """argument : expression"""
-    p[0] = p[1]
+    p[0] = _expr_text(p[1])
 
 # -------- C++ Code Generation --------
 
@@ -482,8 +668,8 @@ def _format_for_assignment(assign_node, include_type=True, var_dtype=None):
     For set-to-set copies or complex expressions, uses var = value.
     For regular types, always uses var = value.
     """
-    var = assign_node["var"]
-    value = assign_node["value"]
+    var = assign_node.var
+    value = assign_node.value
     
     # Check if this is any kind of set type
     is_set_type = var_dtype in ["set", "set_int", "set_float", "set_double", "set_char", "set_string"]
@@ -523,106 +709,140 @@ def _format_for_assignment(assign_node, include_type=True, var_dtype=None):
     return f"{var} = {value}"
 
 
-def generate_cpp(parsed, indent=0, declared=None):
-    """Generate C++ code from parsed AST with proper declaration handling."""
-    cpp = ""
+def _emit_function(stmt, indent, declared, out):
+    params = stmt.params
+    fn_symbols = stmt.symbols
+
+    # Build parameter signature with types
+    param_parts = []
+    for param in params:
+        dtype = fn_symbols.get(param, "")
+        if not dtype:
+            dtype = ask_type(param)
+            fn_symbols[param] = dtype
+        cpp_type = _get_cpp_type(dtype)  # Map pseudo type to C++
+        param_parts.append(f"{cpp_type} {param}")
+    param_sig = ", ".join(param_parts)
+
+    # Map return type to C++
+    ret_cpp_type = _get_cpp_type(stmt.return_type)
+    out.append(f"{ret_cpp_type} {stmt.name}({param_sig}) {{\n")
+
+    # Parameters are pre-declared, mark them as dict with types
+    func_declared = {param: fn_symbols.get(param, "int") for param in params}
+
+    # Collect ALL variables that need declaration (excluding parameters)
+    vars_to_declare = []
+    for var, dtype in stmt.locals.items():
+        if var not in func_declared and dtype:
+            vars_to_declare.append((var, dtype))
+            func_declared[var] = dtype
+
+    # Emit all variable declarations at the top of function
+    if vars_to_declare:
+        decl_prefix = indent_str(indent + 1)
+        out.extend(
+            f"{decl_prefix}{_get_cpp_type(dtype)} {var};\n"
+            for var, dtype in vars_to_declare
+        )
+        # Add blank line after declarations for readability
+        out.append("\n")
+
+    # Generate function body (no more declarations will happen)
+    generate_cpp(stmt.body, indent + 1, declared=func_declared, out=out)
+    out.append("}\n\n")
+
+
+def _emit_assign(stmt, indent, declared, out):
+    # Assignment - check if variable is a set type
+    var = stmt.var
+    # Get dtype from declared dict (func_declared)
+    var_dtype = declared.get(var) if isinstance(declared, dict) else None
+    space = indent_str(indent)
+    out.append(space + _format_for_assignment(stmt, include_type=False, var_dtype=var_dtype) + ";\n")
+
+
+def _emit_declare(stmt, indent, declared, out):
+    # Declaration-only statement: no code generation needed
+    # (variable was already registered in symbol_table during parsing)
+    pass
+
+
+def _emit_if(stmt, indent, declared, out):
+    def _gen_if(body, ind):
+        generate_cpp(body, ind, declared=declared, out=out)
+    generate_if_cpp(stmt, indent, _gen_if, out)
+
+
+def _emit_while(stmt, indent, declared, out):
+    def _gen_while(body, ind):
+        generate_cpp(body, ind, declared=declared, out=out)
+    generate_while_cpp(stmt, indent, _gen_while, out)
+
+
+def _emit_for(stmt, indent, declared, out):
+    def _gen_for(body, ind):
+        generate_cpp(body, ind, declared=declared, out=out)
+    # Create wrapper for _format_for_assignment that includes dtype info
+    def format_assign_with_type(assign_node, include_type=True):
+        var = assign_node.var
+        # Use declared dict (function scope) instead of global symbol_table
+        var_dtype = declared.get(var) if isinstance(declared, dict) else None
+        return _format_for_assignment(assign_node, include_type, var_dtype)
+    generate_for_cpp(
+        stmt,
+        indent,
+        format_assign_with_type,
+        _gen_for,
+        out,
+    )
+
+
+def _emit_function_call(stmt, indent, declared, out):
+    space = indent_str(indent)
+    out.append(space + f"{stmt.name}({stmt.args});\n")
+
+
+def _emit_return(stmt, indent, declared, out):
+    space = indent_str(indent)
+    out.append(space + f"return {stmt.value};\n")
+
+
+# Statement node class -> emitter. Each emitter takes (stmt, indent, declared, out)
+# and appends its C++ fragments to ``out``.
+_HANDLERS = {
+    Function: _emit_function,
+    Assign: _emit_assign,
+    Declare: _emit_declare,
+    If: _emit_if,
+    While: _emit_while,
+    For: _emit_for,
+    FunctionCall: _emit_function_call,
+    Return: _emit_return,
+}
+
+
+def generate_cpp(parsed, indent=0, declared=None, out=None):
+    """Generate C++ code from parsed AST with proper declaration handling.
+
+    Fragments are appended to ``out``. When no buffer is passed in, a new one
+    is created and the joined C++ string is returned; nested calls share the
+    caller's buffer and return nothing.
+    """
+    top_level = out is None
+    if top_level:
+        out = []
     if declared is None:
         declared = set()
-    space = " " * (indent * 4)
 
     for stmt in parsed:
-        stype = stmt["type"]
-
-        if stype == "function":
-            params = stmt.get("params", [])
-            fn_symbols = stmt.get("symbols", {})
-
-            # Build parameter signature with types
-            param_parts = []
-            for param in params:
-                dtype = fn_symbols.get(param, "")
-                if not dtype:
-                    dtype = ask_type(param)
-                    fn_symbols[param] = dtype
-                cpp_type = _get_cpp_type(dtype)  # Map pseudo type to C++
-                param_parts.append(f"{cpp_type} {param}")
-            param_sig = ", ".join(param_parts)
-
-            # Map return type to C++
-            ret_cpp_type = _get_cpp_type(stmt['return_type'])
-            cpp += f"{ret_cpp_type} {stmt['name']}({param_sig}) {{\n"
-
-            # Parameters are pre-declared, mark them as dict with types
-            func_declared = {param: fn_symbols.get(param, "int") for param in params}
-            
-            # Collect ALL variables that need declaration (excluding parameters)
-            vars_to_declare = []
-            for var, dtype in fn_symbols.items():
-                if var.startswith("__"):
-                    continue
-                if var not in func_declared and dtype:
-                    vars_to_declare.append((var, dtype))
-                    func_declared[var] = dtype
-            
-            # Emit all variable declarations at the top of function
-            if vars_to_declare:
-                for var, dtype in vars_to_declare:
-                    cpp_type = _get_cpp_type(dtype)
-                    cpp += " " * ((indent + 1) * 4) + f"{cpp_type} {var};\n"
-                # Add blank line after declarations for readability
-                cpp += "\n"
-            
-            # Generate function body (no more declarations will happen)
-            cpp += generate_cpp(stmt["body"], indent + 1, declared=func_declared)
-            cpp += "}\n\n"
-
-        elif stype == "assign":
-            # Assignment - check if variable is a set type
-            var = stmt.get("var")
-            # Get dtype from declared dict (func_declared)
-            var_dtype = declared.get(var) if isinstance(declared, dict) else None
-            # Try to get dtype from function symbols if not in declared
-            if not var_dtype and var in symbol_table:
-                var_dtype = symbol_table.get(var)
-            cpp += space + _format_for_assignment(stmt, include_type=False, var_dtype=var_dtype) + ";\n"
-
-        elif stype == "declare":
-            # Declaration-only statement: no code generation needed
-            # (variable was already registered in symbol_table during parsing)
-            pass
+        handler = _HANDLERS.get(stmt.__class__)
+        if handler is not None:
+            handler(stmt, indent, declared, out)
 
-        elif stype == "if":
-            def _gen_if(body, ind):
-                return generate_cpp(body, ind, declared=declared)
-            cpp += _if_mod.generate_if_cpp(stmt, indent, _gen_if)
-
-        elif stype == "while":
-            def _gen_while(body, ind):
-                return generate_cpp(body, ind, declared=declared)
-            cpp += _while_mod.generate_while_cpp(stmt, indent, _gen_while)
-
-        elif stype == "for":
-            def _gen_for(body, ind):
-                return generate_cpp(body, ind, declared=declared)
-            # Create wrapper for _format_for_assignment that includes dtype info
-            def format_assign_with_type(assign_node, include_type=True):
-                var = assign_node.get("var")
-                # Use declared dict (function scope) instead of global symbol_table
-                var_dtype = declared.get(var) if isinstance(declared, dict) else None
-                return _format_for_assignment(assign_node, include_type, var_dtype)
-            cpp += _for_mod.generate_for_cpp(
-                stmt,
-                indent,
-                format_assign_with_type,
-                _gen_for,
-            )
-        elif stype == "function_call":
-            cpp += space + f"{stmt['name']}({stmt['args']});\n"
-            
-        elif stype == "return":
-            cpp += space + f"return {stmt['value']};\n"
-
-    return cpp
+    if top_level:
+        return "".join(out)
+    return None
 
 def to_cpp(parsed):
     """Generate complete C++ program from parsed AST."""
@@ -630,14 +850,14 @@ def to_cpp(parsed):
     body = generate_cpp(parsed)
 
     # If user already defined main, don't emit another entry point.
-    has_main = any(fn.get("name") == "main" for fn in parsed if fn.get("type") == "function")
+    has_main = any(fn.name == "main" for fn in parsed if isinstance(fn, Function))
     if has_main:
         return header + body
 
     callable_target = None
     for fn in parsed:
-        if fn.get("type") == "function" and not fn.get("params"):
-            callable_target = fn["name"]
+        if isinstance(fn, Function) and not fn.params:
+            callable_target = fn.name
             break
 
     main_lines = ["int main() {"]
@@ -648,4 +868,88 @@ def to_cpp(parsed):
     main = "\n".join(main_lines) + "\n"
     return header + body + main
 
-parser = yacc.yacc()
+# -------- Parser construction --------
+
+def _parser_cache_path():
+    """Return the on-disk location of the pickled LR tables for this grammar.
+
+    The filename embeds a hash of this module's source, the lexer token list,
+    the PLY version and the Python version, so a grammar change or an
+    interpreter/library upgrade automatically invalidates old caches.
+    """
+    source = "".join((
+        inspect.getsource(sys.modules[__name__]),
+        repr(tokens),
+        yacc.__version__,
+        repr(sys.version_info[:2]),
+    ))
+    digest = hashlib.sha1(source.encode("utf-8")).hexdigest()
+    return Path(__file__).with_name(f".parser-{digest}.pkl")
+
+
+def _bind_callables(lr_parser):
+    """Re-attach grammar actions and the error handler to an unpickled parser."""
+    lr_parser.errorfunc = p_error
+    for prod in lr_parser.productions:
+        prod.bind(globals())
+    return lr_parser
+
+
+def _write_parser_cache(path, lr_parser):
+    """Pickle ``lr_parser`` to ``path`` atomically; failures are non-fatal."""
+    # Actions are module functions and are re-bound on load, so strip them
+    # (and the grammar-analysis state on Production objects) before pickling.
+    productions = lr_parser.productions
+    errorfunc = lr_parser.errorfunc
+    lr_parser.productions = [
+        yacc.MiniProduction(str(prod), prod.name, prod.len, prod.func, prod.file, prod.line)
+        for prod in productions
+    ]
+    lr_parser.errorfunc = None
+    try:
+        data = pickletools.optimize(pickle.dumps(lr_parser, protocol=5))
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return
+    finally:
+        lr_parser.productions = productions
+        lr_parser.errorfunc = errorfunc
+
+    tmp_name = None
+    try:
+        fd, tmp_name = tempfile.mkstemp(prefix=".parser-", suffix=".tmp", dir=path.parent)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except OSError:
+        # Read-only checkout or similar: just rebuild the tables next time.
+        if tmp_name is not None and os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        return
+
+    # Drop caches left behind by earlier versions of the grammar.
+    for stale in path.parent.glob(".parser-*.pkl"):
+        if stale != path:
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+
+
+def _load_parser():
+    """Build the PLY parser, reusing pickled LR tables when available."""
+    path = _parser_cache_path()
+    try:
+        return _bind_callables(pickle.loads(path.read_bytes()))
+    except Exception:
+        # Missing, truncated or incompatible cache: rebuild it below.
+        pass
+
+    # write_tables=False: the pickle above replaces parsetab.py. optimize is
+    # deliberately left off, since it only makes PLY trust any importable
+    # parsetab module without checking its signature.
+    lr_parser = yacc.yacc(debug=False, write_tables=False)
+    _write_parser_cache(path, lr_parser)
+    return lr_parser
+
+
+parser = _load_parser()
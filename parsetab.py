@@ -1,88 +0,0 @@
-
-# parsetab.py
-# This file is automatically generated. Do not edit.
-# pylint: disable=W,C,R
-_tabversion = '3.10'
-
-_lr_method = 'LALR'
-
-_lr_signature = 'AND ASSIGN BOOL BREAK CHAR COMMA CONTINUE DECL DIVIDE ELSE EQ FN FOR GE GT ID IF LBRACE LE LPAREN LT MINUS MOD NE NOT NUMBER OR PLUS PRINT RBRACE RETURN RPAREN SCAN SEMICOLON STRING TIMES WHILEprogram : function_listfunction_list : function_list function\n| functionfunction_header : FN ID LPAREN param_list_opt RPARENfunction : function_header LBRACE stmt_list RBRACEparam_list_opt : param_list\n| emptyparam_list : ID\n| param_list COMMA IDstmt_list : stmt_list statement\n| statement\n| emptystatement : ID ASSIGN NUMBER SEMICOLON\n| ID ASSIGN ID SEMICOLONstatement : ID ASSIGN expression SEMICOLONstatement : DECL ID SEMICOLONstatement : IF LPAREN condition RPAREN LBRACE stmt_list RBRACEstatement : WHILE LPAREN condition RPAREN LBRACE stmt_list RBRACEstatement : FOR LPAREN for_init_opt SEMICOLON condition_opt SEMICOLON for_update_opt RPAREN LBRACE stmt_list RBRACEfor_init_opt : ID ASSIGN NUMBER\n| ID ASSIGN ID\n| ID ASSIGN expression\n| emptycondition_opt : condition\n| emptyfor_update_opt : ID ASSIGN NUMBER\n| ID ASSIGN ID\n| ID ASSIGN expression\n| emptystatement : RETURN expression SEMICOLON\n| RETURN NUMBER SEMICOLON\n| RETURN ID SEMICOLONstatement : ID LPAREN argument_list_opt RPAREN SEMICOLONexpression : expression PLUS term\n| expression MINUS termexpression : termterm : term TIMES factor\n| term DIVIDE factor\n| term MOD factorterm : factorfactor : NUMBERfactor : STRINGfactor : CHARfactor : IDfactor : LPAREN expression RPARENcondition : expression LT expression\n| expression GT expression\n| expression LE expression\n| expression GE expression\n| expression EQ expression\n| expression NE expressionempty :factor : ID LPAREN argument_list_opt RPARENargument_list_opt : argument_list\n| emptyargument_list : argument\n| argument_list COMMA argumentargument : expression'
-    
-_lr_action_items = {'FN':([0,2,3,6,19,],[5,5,-3,-2,-5,]),'$end':([1,2,3,6,19,],[0,-1,-3,-2,-5,]),'LBRACE':([4,66,73,80,116,],[7,-4,93,100,118,]),'ID':([5,7,9,10,11,13,17,18,20,21,22,24,25,26,34,49,56,57,58,59,60,61,62,63,64,67,68,69,70,72,74,75,76,77,78,79,81,82,91,93,100,108,109,110,111,112,117,118,122,123,],[8,12,12,-11,-12,23,29,35,-10,39,42,42,42,54,42,-16,-30,42,42,-31,-32,42,42,42,42,90,-14,-13,-15,42,42,42,42,42,42,42,42,104,-33,12,12,12,12,114,-17,-18,119,12,12,-19,]),'DECL':([7,9,10,11,20,49,56,59,60,68,69,70,91,93,100,108,109,111,112,118,122,123,],[13,13,-11,-12,-10,-16,-30,-31,-32,-14,-13,-15,-33,13,13,13,13,-17,-18,13,13,-19,]),'IF':([7,9,10,11,20,49,56,59,60,68,69,70,91,93,100,108,109,111,112,118,122,123,],[14,14,-11,-12,-10,-16,-30,-31,-32,-14,-13,-15,-33,14,14,14,14,-17,-18,14,14,-19,]),'WHILE':([7,9,10,11,20,49,56,59,60,68,69,70,91,93,100,108,109,111,112,118,122,123,],[15,15,-11,-12,-10,-16,-30,-31,-32,-14,-13,-15,-33,15,15,15,15,-17,-18,15,15,-19,]),'FOR':([7,9,10,11,20,49,56,59,60,68,69,70,91,93,100,108,109,111,112,118,122,123,],[16,16,-11,-12,-10,-16,-30,-31,-32,-14,-13,-15,-33,16,16,16,16,-17,-18,16,16,-19,]),'RETURN':([7,9,10,11,20,49,56,59,60,68,69,70,91,93,100,108,109,111,112,118,122,123,],[17,17,-11,-12,-10,-16,-30,-31,-32,-14,-13,-15,-33,17,17,17,17,-17,-18,17,17,-19,]),'RBRACE':([7,9,10,11,20,49,56,59,60,68,69,70,91,93,100,108,109,111,112,118,122,123,],[-52,19,-11,-12,-10,-16,-30,-31,-32,-14,-13,-15,-33,-52,-52,111,112,-17,-18,-52,123,-19,]),'LPAREN':([8,12,14,15,16,17,21,22,24,25,29,34,39,42,57,58,61,62,63,64,72,74,75,76,77,78,79,81,82,104,117,119,],[18,22,24,25,26,34,34,34,34,34,61,34,61,61,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,61,34,61,]),'ASSIGN':([12,54,114,],[21,82,117,]),'NUMBER':([17,21,22,24,25,34,57,58,61,62,63,64,72,74,75,76,77,78,79,81,82,117,],[28,40,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,105,120,]),'STRING':([17,21,22,24,25,34,57,58,61,62,63,64,72,74,75,76,77,78,79,81,82,117,],[32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,]),'CHAR':([17,21,22,24,25,34,57,58,61,62,63,64,72,74,75,76,77,78,79,81,82,117,],[33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,]),'RPAREN':([18,22,30,31,32,33,35,36,37,38,42,43,44,45,46,47,48,50,52,61,65,83,84,85,86,87,88,89,90,92,94,95,96,97,98,99,107,110,113,115,119,120,121,],[-52,-52,-36,-40,-42,-43,-8,66,-6,-7,-44,71,-54,-55,-56,-58,-41,73,80,-52,89,-34,-35,107,-37,-38,-39,-45,-9,-57,-46,-47,-48,-49,-50,-51,-53,-52,116,-29,-27,-26,-28,]),'SEMICOLON':([23,26,27,28,29,30,31,32,33,39,40,41,42,48,53,55,71,81,83,84,86,87,88,89,94,95,96,97,98,99,101,102,103,104,105,106,107,],[49,-52,56,59,60,-36,-40,-42,-43,68,69,70,-44,-41,81,-23,91,-52,-34,-35,-37,-38,-39,-45,-46,-47,-48,-49,-50,-51,110,-24,-25,-21,-20,-22,-53,]),'PLUS':([27,28,29,30,31,32,33,39,40,41,42,47,48,51,65,83,84,86,87,88,89,94,95,96,97,98,99,104,105,106,107,119,120,121,],[57,-41,-44,-36,-40,-42,-43,-44,-41,57,-44,57,-41,57,57,-34,-35,-37,-38,-39,-45,57,57,57,57,57,57,-44,-41,57,-53,-44,-41,57,]),'MINUS':([27,28,29,30,31,32,33,39,40,41,42,47,48,51,65,83,84,86,87,88,89,94,95,96,97,98,99,104,105,106,107,119,120,121,],[58,-41,-44,-36,-40,-42,-43,-44,-41,58,-44,58,-41,58,58,-34,-35,-37,-38,-39,-45,58,58,58,58,58,58,-44,-41,58,-53,-44,-41,58,]),'TIMES':([28,29,30,31,32,33,39,40,42,48,83,84,86,87,88,89,104,105,107,119,120,],[-41,-44,62,-40,-42,-43,-44,-41,-44,-41,62,62,-37,-38,-39,-45,-44,-41,-53,-44,-41,]),'DIVIDE':([28,29,30,31,32,33,39,40,42,48,83,84,86,87,88,89,104,105,107,119,120,],[-41,-44,63,-40,-42,-43,-44,-41,-44,-41,63,63,-37,-38,-39,-45,-44,-41,-53,-44,-41,]),'MOD':([28,29,30,31,32,33,39,40,42,48,83,84,86,87,88,89,104,105,107,119,120,],[-41,-44,64,-40,-42,-43,-44,-41,-44,-41,64,64,-37,-38,-39,-45,-44,-41,-53,-44,-41,]),'COMMA':([30,31,32,33,35,37,42,44,46,47,48,83,84,86,87,88,89,90,92,107,],[-36,-40,-42,-43,-8,67,-44,72,-56,-58,-41,-34,-35,-37,-38,-39,-45,-9,-57,-53,]),'LT':([30,31,32,33,42,48,51,83,84,86,87,88,89,107,],[-36,-40,-42,-43,-44,-41,74,-34,-35,-37,-38,-39,-45,-53,]),'GT':([30,31,32,33,42,48,51,83,84,86,87,88,89,107,],[-36,-40,-42,-43,-44,-41,75,-34,-35,-37,-38,-39,-45,-53,]),'LE':([30,31,32,33,42,48,51,83,84,86,87,88,89,107,],[-36,-40,-42,-43,-44,-41,76,-34,-35,-37,-38,-39,-45,-53,]),'GE':([30,31,32,33,42,48,51,83,84,86,87,88,89,107,],[-36,-40,-42,-43,-44,-41,77,-34,-35,-37,-38,-39,-45,-53,]),'EQ':([30,31,32,33,42,48,51,83,84,86,87,88,89,107,],[-36,-40,-42,-43,-44,-41,78,-34,-35,-37,-38,-39,-45,-53,]),'NE':([30,31,32,33,42,48,51,83,84,86,87,88,89,107,],[-36,-40,-42,-43,-44,-41,79,-34,-35,-37,-38,-39,-45,-53,]),}
-
-_lr_action = {}
-for _k, _v in _lr_action_items.items():
-   for _x,_y in zip(_v[0],_v[1]):
-      if not _x in _lr_action:  _lr_action[_x] = {}
-      _lr_action[_x][_k] = _y
-del _lr_action_items
-
-_lr_goto_items = {'program':([0,],[1,]),'function_list':([0,],[2,]),'function':([0,2,],[3,6,]),'function_header':([0,2,],[4,4,]),'stmt_list':([7,93,100,118,],[9,108,109,122,]),'statement':([7,9,93,100,108,109,118,122,],[10,20,10,10,20,20,10,20,]),'empty':([7,18,22,26,61,81,93,100,110,118,],[11,38,45,55,45,103,11,11,115,11,]),'expression':([17,21,22,24,25,34,61,72,74,75,76,77,78,79,81,82,117,],[27,41,47,51,51,65,47,47,94,95,96,97,98,99,51,106,121,]),'term':([17,21,22,24,25,34,57,58,61,72,74,75,76,77,78,79,81,82,117,],[30,30,30,30,30,30,83,84,30,30,30,30,30,30,30,30,30,30,30,]),'factor':([17,21,22,24,25,34,57,58,61,62,63,64,72,74,75,76,77,78,79,81,82,117,],[31,31,31,31,31,31,31,31,31,86,87,88,31,31,31,31,31,31,31,31,31,31,]),'param_list_opt':([18,],[36,]),'param_list':([18,],[37,]),'argument_list_opt':([22,61,],[43,85,]),'argument_list':([22,61,],[44,44,]),'argument':([22,61,72,],[46,46,92,]),'condition':([24,25,81,],[50,52,102,]),'for_init_opt':([26,],[53,]),'condition_opt':([81,],[101,]),'for_update_opt':([110,],[113,]),}
-
-_lr_goto = {}
-for _k, _v in _lr_goto_items.items():
-   for _x, _y in zip(_v[0], _v[1]):
-       if not _x in _lr_goto: _lr_goto[_x] = {}
-       _lr_goto[_x][_k] = _y
-del _lr_goto_items
-_lr_productions = [
-  ("S' -> program","S'",1,None,None,None),
-  ('program -> function_list','program',1,'p_program','parser.py',137),
-  ('function_list -> function_list function','function_list',2,'p_function_list','parser.py',142),
-  ('function_list -> function','function_list',1,'p_function_list','parser.py',143),
-  ('function_header -> FN ID LPAREN param_list_opt RPAREN','function_header',5,'p_function_header','parser.py',151),
-  ('function -> function_header LBRACE stmt_list RBRACE','function',4,'p_function','parser.py',160),
-  ('param_list_opt -> param_list','param_list_opt',1,'p_param_list_opt','parser.py',193),
-  ('param_list_opt -> empty','param_list_opt',1,'p_param_list_opt','parser.py',194),
-  ('param_list -> ID','param_list',1,'p_param_list','parser.py',202),
-  ('param_list -> param_list COMMA ID','param_list',3,'p_param_list','parser.py',203),
-  ('stmt_list -> stmt_list statement','stmt_list',2,'p_stmt_list','parser.py',211),
-  ('stmt_list -> statement','stmt_list',1,'p_stmt_list','parser.py',212),
-  ('stmt_list -> empty','stmt_list',1,'p_stmt_list','parser.py',213),
-  ('statement -> ID ASSIGN NUMBER SEMICOLON','statement',4,'p_statement_assign_simple','parser.py',223),
-  ('statement -> ID ASSIGN ID SEMICOLON','statement',4,'p_statement_assign_simple','parser.py',224),
-  ('statement -> ID ASSIGN expression SEMICOLON','statement',4,'p_statement_assign_expr','parser.py',232),
-  ('statement -> DECL ID SEMICOLON','statement',3,'p_statement_declare','parser.py',240),
-  ('statement -> IF LPAREN condition RPAREN LBRACE stmt_list RBRACE','statement',7,'p_statement_if','parser.py',252),
-  ('statement -> WHILE LPAREN condition RPAREN LBRACE stmt_list RBRACE','statement',7,'p_statement_while','parser.py',257),
-  ('statement -> FOR LPAREN for_init_opt SEMICOLON condition_opt SEMICOLON for_update_opt RPAREN LBRACE stmt_list RBRACE','statement',11,'p_statement_for','parser.py',262),
-  ('for_init_opt -> ID ASSIGN NUMBER','for_init_opt',3,'p_for_init_opt','parser.py',273),
-  ('for_init_opt -> ID ASSIGN ID','for_init_opt',3,'p_for_init_opt','parser.py',274),
-  ('for_init_opt -> ID ASSIGN expression','for_init_opt',3,'p_for_init_opt','parser.py',275),
-  ('for_init_opt -> empty','for_init_opt',1,'p_for_init_opt','parser.py',276),
-  ('condition_opt -> condition','condition_opt',1,'p_condition_opt','parser.py',289),
-  ('condition_opt -> empty','condition_opt',1,'p_condition_opt','parser.py',290),
-  ('for_update_opt -> ID ASSIGN NUMBER','for_update_opt',3,'p_for_update_opt','parser.py',295),
-  ('for_update_opt -> ID ASSIGN ID','for_update_opt',3,'p_for_update_opt','parser.py',296),
-  ('for_update_opt -> ID ASSIGN expression','for_update_opt',3,'p_for_update_opt','parser.py',297),
-  ('for_update_opt -> empty','for_update_opt',1,'p_for_update_opt','parser.py',298),
-  ('statement -> RETURN expression SEMICOLON','statement',3,'p_statement_return','parser.py',312),
-  ('statement -> RETURN NUMBER SEMICOLON','statement',3,'p_statement_return','parser.py',313),
-  ('statement -> RETURN ID SEMICOLON','statement',3,'p_statement_return','parser.py',314),
-  ('statement -> ID LPAREN argument_list_opt RPAREN SEMICOLON','statement',5,'p_statement_function_call','parser.py',327),
-  ('expression -> expression PLUS term','expression',3,'p_expression_binop_addsub','parser.py',341),
-  ('expression -> expression MINUS term','expression',3,'p_expression_binop_addsub','parser.py',342),
-  ('expression -> term','expression',1,'p_expression_term','parser.py',347),
-  ('term -> term TIMES factor','term',3,'p_term_binop','parser.py',352),
-  ('term -> term DIVIDE factor','term',3,'p_term_binop','parser.py',353),
-  ('term -> term MOD factor','term',3,'p_term_binop','parser.py',354),
-  ('term -> factor','term',1,'p_term_factor','parser.py',359),
-  ('factor -> NUMBER','factor',1,'p_factor_number','parser.py',364),
-  ('factor -> STRING','factor',1,'p_factor_string','parser.py',369),
-  ('factor -> CHAR','factor',1,'p_factor_char','parser.py',376),
-  ('factor -> ID','factor',1,'p_factor_id','parser.py',383),
-  ('factor -> LPAREN expression RPAREN','factor',3,'p_factor_group','parser.py',392),
-  ('condition -> expression LT expression','condition',3,'p_condition','parser.py',397),
-  ('condition -> expression GT expression','condition',3,'p_condition','parser.py',398),
-  ('condition -> expression LE expression','condition',3,'p_condition','parser.py',399),
-  ('condition -> expression GE expression','condition',3,'p_condition','parser.py',400),
-  ('condition -> expression EQ expression','condition',3,'p_condition','parser.py',401),
-  ('condition -> expression NE expression','condition',3,'p_condition','parser.py',402),
-  ('empty -> <empty>','empty',0,'p_empty','parser.py',407),
-  ('factor -> ID LPAREN argument_list_opt RPAREN','factor',4,'p_factor_function_call','parser.py',422),
-  ('argument_list_opt -> argument_list','argument_list_opt',1,'p_argument_list_opt','parser.py',437),
-  ('argument_list_opt -> empty','argument_list_opt',1,'p_argument_list_opt','parser.py',438),
-  ('argument_list -> argument','argument_list',1,'p_argument_list','parser.py',443),
-  ('argument_list -> argument_list COMMA argument','argument_list',3,'p_argument_list','parser.py',444),
-  ('argument -> expression','argument',1,'p_argument','parser.py',452),
-]
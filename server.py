@@ -1,11 +1,35 @@
+import functools
+
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 
-from parser import parser, to_cpp, register_type_provider, MissingTypeError, valid_dtypes, parse_code
+from parser import parser, to_cpp, parse_context, MissingTypeError, valid_dtypes, valid_dtypes_set, parse_code
 
 app = Flask(__name__)
 CORS(app, resources={r"/*": {"origins": "*"}})
 
+# Tiny program exercised once per process so the first /convert request does
+# not pay for parser construction or PLY's first-parse setup.
+_PREWARM_SNIPPET = r"\Fn f() { \KwRet 0; }"
+
+
+def _prewarm():
+    """Run a throwaway parse so the imported parser is warm in this process."""
+    with parse_context(lambda var, allowed: "int"):
+        to_cpp(parse_code(_PREWARM_SNIPPET))
+
+
+_prewarm()
+
+
+def post_fork(server, worker):
+    """Gunicorn hook (``gunicorn -c python:server server:app``).
+
+    Re-runs the warm-up in each forked worker so per-process state is hot
+    before the first request arrives.
+    """
+    _prewarm()
+
 
 def make_http_type_provider(type_hints: dict):
     """Create a non-interactive type provider for HTTP requests.
@@ -20,13 +44,42 @@ def make_http_type_provider(type_hints: dict):
         if not isinstance(type_hints, dict):
             raise MissingTypeError(var)
         dtype = type_hints.get(var)
-        if not isinstance(dtype, str) or dtype not in allowed:
+        if not isinstance(dtype, str) or dtype not in valid_dtypes_set:
             raise MissingTypeError(var)
         return dtype
 
     return _provider
 
 
+def _canonical_type_hints(type_hints):
+    """Return a hashable, order-independent form of ``type_hints``.
+
+    Only string datatypes are kept: anything else is treated as missing by
+    ``make_http_type_provider`` anyway, so dropping it does not change the
+    conversion result.
+    """
+    if not isinstance(type_hints, dict):
+        return ()
+    return tuple(sorted(
+        (var, dtype) for var, dtype in type_hints.items()
+        if isinstance(var, str) and isinstance(dtype, str)
+    ))
+
+
+@functools.lru_cache(maxsize=2000)
+def _convert_cached(code, type_hints):
+    """Parse ``code`` and emit C++, memoized on (code, canonical type hints).
+
+    Conversion is deterministic for a given input, so repeated requests skip
+    parsing and code generation. ``MissingTypeError`` and ``SyntaxError``
+    propagate and are therefore never cached.
+    """
+    # Use a request-scoped type provider so the parser never reads stdin and
+    # concurrent requests on other threads keep their own parse state.
+    with parse_context(make_http_type_provider(dict(type_hints))):
+        return to_cpp(parse_code(code))
+
+
 @app.route("/convert", methods=["POST"])
 def convert():
     data = request.get_json(silent=True) or {}
@@ -36,12 +89,8 @@ def convert():
     if not code.strip():
         return jsonify({"error": "No code provided"}), 400
 
-    # Register a request-scoped type provider so the parser never reads stdin.
-    register_type_provider(make_http_type_provider(type_hints))
-
     try:
-        parsed = parse_code(code)
-        cpp_code = to_cpp(parsed)
+        cpp_code = _convert_cached(code, _canonical_type_hints(type_hints))
         return jsonify({"cpp": cpp_code})
     except MissingTypeError as e:
         # Let the frontend know which variable needs a datatype.
@@ -63,7 +112,18 @@ def convert():
 
 @app.route("/health", methods=["GET"])
 def health():
-    return jsonify({"status": "ok"})
+    info = _convert_cached.cache_info()
+    return jsonify(
+        {
+            "status": "ok",
+            "cache": {
+                "hits": info.hits,
+                "misses": info.misses,
+                "size": info.currsize,
+                "maxsize": info.maxsize,
+            },
+        }
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Checks for per-thread parse state (ParseContext / parse_context).
+Runs conversions with conflicting type providers on several threads and
+verifies each thread only ever sees its own provider's types.
+"""
+
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add parent dir to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from parser import parse_code, to_cpp, parse_context, register_type_provider
+
+CODE = r"""
+\Fn f(x) {
+    a \gets x + 1;
+    \For(i \gets 0; i < x; i \gets i + 1) {
+        a \gets a * 2;
+    }
+    \KwRet a;
+}
+"""
+
+# Two providers that disagree on every variable.
+HINTS = {
+    "int": {"a": "int", "x": "int", "i": "int", "function_return_type": "int"},
+    "float": {"a": "float", "x": "float", "i": "long", "function_return_type": "float"},
+}
+
+EXPECTED_SIGNATURE = {
+    "int": "int f(int x) {",
+    "float": "float f(float x) {",
+}
+
+
+def make_provider(hints):
+    def provider(var, allowed):
+        return hints[var]
+    return provider
+
+
+def convert_with(kind):
+    with parse_context(make_provider(HINTS[kind])):
+        return to_cpp(parse_code(CODE))
+
+
+def test_threads_keep_their_own_provider():
+    reference = {kind: convert_with(kind) for kind in HINTS}
+    for kind, cpp in reference.items():
+        assert EXPECTED_SIGNATURE[kind] in cpp, cpp
+    assert "long i;" in reference["float"]
+
+    kinds = [kind for _ in range(200) for kind in HINTS]
+    barrier = threading.Barrier(8)
+
+    def job(kind):
+        # Line threads up so parses actually overlap.
+        try:
+            barrier.wait(timeout=1)
+        except threading.BrokenBarrierError:
+            pass
+        return kind, convert_with(kind)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(job, kinds))
+
+    for kind, cpp in results:
+        assert cpp == reference[kind], f"{kind} thread got output for another provider:\n{cpp}"
+
+
+def test_registered_provider_is_default():
+    register_type_provider(make_provider(HINTS["float"]))
+    try:
+        cpp = to_cpp(parse_code(CODE))
+        assert cpp == convert_with("float"), cpp
+
+        # An explicit context overrides the registered default...
+        assert EXPECTED_SIGNATURE["int"] in convert_with("int")
+        # ...and the default applies again once it has exited.
+        assert to_cpp(parse_code(CODE)) == cpp
+    finally:
+        register_type_provider(None)
+
+
+def main():
+    tests = [test_threads_keep_their_own_provider, test_registered_provider_is_default]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"[X] {test.__name__} - {e}")
+        else:
+            print(f"[OK] {test.__name__}")
+    print(f"\nRESULTS: {len(tests) - failed} passed, {failed} failed")
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
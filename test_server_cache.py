@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Checks for the /convert result cache reported on /health.
+Uses Flask's test client, so no server needs to be running.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent dir to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from server import app, _convert_cached
+
+CODE = r"\Fn f() { a \gets 1; b \gets a + 2; }"
+
+
+def cache_stats(client):
+    return client.get("/health").get_json()["cache"]
+
+
+def convert(client, code, types):
+    return client.post("/convert", json={"code": code, "types": types})
+
+
+def test_repeat_request_hits_cache():
+    _convert_cached.cache_clear()
+    client = app.test_client()
+
+    first = convert(client, CODE, {"a": "int", "b": "int"})
+    assert first.status_code == 200, first.get_json()
+    stats = cache_stats(client)
+    assert (stats["hits"], stats["misses"]) == (0, 1), stats
+
+    second = convert(client, CODE, {"a": "int", "b": "int"})
+    assert second.get_json() == first.get_json()
+    stats = cache_stats(client)
+    assert (stats["hits"], stats["misses"]) == (1, 1), stats
+
+
+def test_hint_order_does_not_matter():
+    _convert_cached.cache_clear()
+    client = app.test_client()
+
+    convert(client, CODE, {"a": "int", "b": "float"})
+    convert(client, CODE, {"b": "float", "a": "int"})
+    stats = cache_stats(client)
+    assert (stats["hits"], stats["size"]) == (1, 1), stats
+
+
+def test_errors_are_not_cached():
+    _convert_cached.cache_clear()
+    client = app.test_client()
+
+    for _ in range(2):
+        missing = convert(client, CODE, {"a": "int"})
+        assert missing.status_code == 400
+        assert missing.get_json()["error"] == "missing_type"
+
+        syntax = convert(client, r"\Fn f() { a \gets ; }", {"a": "int"})
+        assert syntax.status_code == 400
+        assert "Syntax error" in syntax.get_json()["error"]
+
+    stats = cache_stats(client)
+    assert (stats["hits"], stats["size"]) == (0, 0), stats
+
+
+def main():
+    tests = [test_repeat_request_hits_cache, test_hint_order_does_not_matter, test_errors_are_not_cached]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"[X] {test.__name__} - {e}")
+        else:
+            print(f"[OK] {test.__name__}")
+    print(f"\nRESULTS: {len(tests) - failed} passed, {failed} failed")
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())